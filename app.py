@@ -1,53 +1,370 @@
 #!/usr/bin/env python3
 
-import urllib.request
-import urllib.error
-import urllib.parse
-from urllib.parse import urljoin, urlparse
+import asyncio
+import hashlib
+import math
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 import datetime
-import time
 import re
 import os
 import json
-import ssl
-from collections import defaultdict
+import sqlite3
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
-# Bypass SSL verification
-ssl._create_default_https_context = ssl._create_unverified_context
+import aiohttp
+
+try:
+    from lxml import etree
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+try:
+    # RE2's DFA scans in linear time - no catastrophic backtracking on
+    # pathological link strings in large HTML bodies
+    import re2 as _re
+except ImportError:
+    _re = re
+
+try:
+    # C-backed HTML parser - faster and more correct than the href regex
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    # Rust JSON encoder - several times faster than stdlib json on big reports
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # SIMD-accelerated DEFLATE (Intel ISA-L) - drop-in gzip replacement;
+    # it only supports levels 0-3, but level 1 already beats zlib level 6
+    # on throughput at comparable XML ratios
+    from isal import igzip as gzip
+    _GZIP_LEVEL = 1
+except ImportError:
+    import gzip
+    _GZIP_LEVEL = 6
+
+# Precompiled patterns - compiled once at import so the hot parsing loops
+# skip the per-call cache lookup entirely
+_HREF_RE = _re.compile(r'href=["\']([^"\']+)["\']', re.IGNORECASE)
+_HREF_RE_B = _re.compile(rb'href=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# File types that never belong in a sitemap, tested against the path's
+# extension so query strings can neither hide nor fake one
+_SKIP_EXTS = frozenset({
+    'jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'ico',
+    'pdf', 'doc', 'docx', 'zip', 'rar',
+    'mp4', 'mp3', 'avi', 'mov',
+    'css', 'js', 'woff', 'ttf'
+})
+
+# Common non-content URLs
+_EXCLUDED_PATTERNS = [
+    '/cdn-cgi/', '/wp-admin/', '/wp-json/', '/api/', '/ajax/',
+    '/logout', '/login', '/signin', '/signup', '/register',
+    '/admin', '/dashboard', '/backend',
+    '/cart', '/checkout', '/account',
+    '?replytocom=', '?share=', '?feed=', '?s=',
+    '#', 'tel:', 'mailto:', 'javascript:'
+]
+
+# Matches "Sitemap: <url>" directives anywhere in robots.txt in one pass
+_SITEMAP_DIRECTIVE_RE = re.compile(r'(?im)^\s*sitemap\s*:\s*(\S+)\s*$')
+
+_XML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;'
+})
+
+# Per-URL sitemap entry template - one %-format per URL instead of five
+# f-string writes
+_URL_TEMPLATE = (
+    '  <url>\n'
+    '    <loc>%s</loc>\n'
+    '    <lastmod>%s</lastmod>\n'
+    '    <changefreq>%s</changefreq>\n'
+    '    <priority>%s</priority>\n'
+    '  </url>\n'
+)
+
+# One DFA scan identifies the content category via the named group that
+# matched; the table below maps each group to its sitemap attributes
+_CATEGORY_RE = re.compile(
+    r'(?P<contact>/contact|/connect|/get-in-touch)'
+    r'|(?P<about>/about|/company)'
+    r'|(?P<articles>/(?:article|news|blog|post|story)/)'
+    r'|(?P<legal>/privacy|/terms|/policy|/disclaimer)'
+)
+
+_CATEGORY_RULES = {
+    'contact': {'category': 'contact', 'priority': '0.8'},
+    'about': {'category': 'about', 'priority': '0.8'},
+    'articles': {'category': 'articles', 'priority': '0.8', 'changefreq': 'daily'},
+    'legal': {'category': 'legal', 'priority': '0.3', 'changefreq': 'yearly'},
+}
+
+# One alternation covering every non-content pattern - each candidate URL
+# is scanned once instead of once per excluded substring
+_EXCL_RE = _re.compile(
+    '|'.join(re.escape(pattern) for pattern in _EXCLUDED_PATTERNS)
+)
+
+# Query parameters that only track campaigns and never change page content
+_TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid'
+}
+
+def canonicalize_url(url: str):
+    """Normalize a URL so trivial variants collapse to one dedup key"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    query = ''
+    if parts.query:
+        query = '&'.join(sorted(
+            pair for pair in parts.query.split('&')
+            if pair and pair.split('=', 1)[0] not in _TRACKING_PARAMS
+        ))
+
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+def _hash64(text: str):
+    """Compact 64-bit digest for exact-membership bookkeeping"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+class _UrlDeduper:
+    """Incremental URL dedup that upgrades to a Bloom filter at scale.
+
+    Ordinary runs keep exact canonical strings in a plain set - the fastest
+    and simplest path. Past _BLOOM_THRESHOLD entries the strings migrate
+    into a Bloom filter backed by compact 64-bit digests, trading ~200
+    bytes per stored URL for ~10 bits, so multi-million-URL crawls stay in
+    tens of megabytes.
+    """
+
+    _BLOOM_THRESHOLD = 1_000_000
+
+    def __init__(self, capacity: int = 10_000_000):
+        self._capacity = capacity
+        self._exact = set()
+        self._bloom = None
+        self._digests = set()
+
+    def add(self, url: str):
+        """Record a URL; returns True the first time its canonical form is seen"""
+        canonical = canonicalize_url(url)
+
+        if self._bloom is None:
+            if canonical in self._exact:
+                return False
+            self._exact.add(canonical)
+            if len(self._exact) >= self._BLOOM_THRESHOLD:
+                self._upgrade_to_bloom()
+            return True
+
+        digest = _hash64(canonical)
+
+        # The Bloom filter handles the fast path; the digest set only
+        # confirms hits so false positives never drop a real URL
+        if canonical in self._bloom and digest in self._digests:
+            return False
+
+        self._bloom.add(canonical)
+        self._digests.add(digest)
+        return True
+
+    def _upgrade_to_bloom(self):
+        """Migrate the exact string set into the Bloom filter + digest set"""
+        self._bloom = _BloomFilter(capacity=self._capacity)
+        for canonical in self._exact:
+            self._bloom.add(canonical)
+            self._digests.add(_hash64(canonical))
+        self._exact = set()
+
+class _FetchCache:
+    """SQLite-backed response cache keyed on URL for conditional GETs.
+
+    Stores each body with its ETag/Last-Modified validators so re-runs can
+    send If-None-Match/If-Modified-Since and skip the download on 304.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)'
+        )
+        # Drop the old body_hash-only page_links table if present - its
+        # entries are absolute URLs resolved against a different page (or
+        # site) and must not be reused under the new composite key
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(page_links)')]
+        if columns and 'page_url' not in columns:
+            self._conn.execute('DROP TABLE page_links')
+
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS page_links '
+            '(page_url TEXT, body_hash TEXT, links TEXT, '
+            'PRIMARY KEY (page_url, body_hash))'
+        )
+
+    def get(self, url: str):
+        row = self._conn.execute(
+            'SELECT etag, last_modified, body FROM responses WHERE url = ?', (url,)
+        ).fetchone()
+        return row
+
+    def put(self, url: str, etag, last_modified, body: bytes):
+        self._conn.execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)',
+            (url, etag, last_modified, body)
+        )
+        self._conn.commit()
+
+    def get_links(self, page_url: str, body_hash: str):
+        row = self._conn.execute(
+            'SELECT links FROM page_links WHERE page_url = ? AND body_hash = ?',
+            (page_url, body_hash)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_links(self, page_url: str, body_hash: str, links):
+        self._conn.execute(
+            'INSERT OR REPLACE INTO page_links VALUES (?, ?, ?)',
+            (page_url, body_hash, json.dumps(links))
+        )
+        self._conn.commit()
+
+class _BloomFilter:
+    """Fixed-size Bloom filter with Kirsch-Mitzenmacher double hashing.
+
+    ~10 bits per element instead of ~200 bytes per URL string in a Python
+    set, so multi-million-URL dedup stays in single-digit megabytes.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 1e-7):
+        capacity = max(capacity, 1024)
+        self.num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray(self.num_bits // 8 + 1)
+
+    def _indexes(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little')
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str):
+        for idx in self._indexes(item):
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, item: str):
+        return all(self._bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(item))
 
 class FixedSitemapGenerator:
-    def __init__(self, base_url: str, max_urls_per_sitemap: int = 50000, max_crawl_pages: int = 1000):
+    def __init__(self, base_url: str, max_urls_per_sitemap: int = 50000, max_crawl_pages: int = 1000,
+                 concurrency: int = 16, compress: bool = True, cache_path: str = None):
         self.base_url = base_url.rstrip('/')
+        self._base_netloc = urlparse(self.base_url).netloc.lower()
         self.max_urls_per_sitemap = max_urls_per_sitemap
         self.max_crawl_pages = max_crawl_pages
+        self.concurrency = concurrency
+        self.compress = compress
+        # One date string for the whole run - lastmod defaults are stamped
+        # once per URL otherwise
+        self._today = datetime.date.today().isoformat()
         self.all_urls = []
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (compatible; FixedSitemapGenerator/2.0)',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+        }
 
-    def fetch_url(self, url: str, max_retries: int = 3):
-        """Fetch URL with proper headers and error handling"""
-        for attempt in range(max_retries):
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (compatible; FixedSitemapGenerator/2.0)',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                }
+        # The conditional-GET cache opens lazily under the output directory
+        # unless an explicit path is given, so nothing lands in cwd
+        self._cache = None
+        if cache_path:
+            self._open_cache(cache_path)
 
-                req = urllib.request.Request(url, headers=headers)
-                response = urllib.request.urlopen(req, timeout=15)
-                content = response.read().decode('utf-8', errors='ignore')
+    def _open_cache(self, path: str):
+        """Open the conditional-GET cache at the given path, best effort"""
+        try:
+            self._cache = _FetchCache(path)
+        except sqlite3.Error:
+            self._cache = None
+
+    def _open_session(self):
+        """Create one shared aiohttp session with pooled keep-alive connections"""
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, keepalive_timeout=30,
+                                         ttl_dns_cache=300, ssl=False)
+        return aiohttp.ClientSession(connector=connector, headers=self.headers)
+
+    async def _fetch(self, session, url: str, max_retries: int = 3, as_bytes: bool = False):
+        """Fetch URL with proper headers, error handling and conditional GETs"""
+        cached = self._cache.get(url) if self._cache else None
+        conditional_headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
 
-                time.sleep(0.5)  # Respectful delay
-                return content
+        for attempt in range(max_retries):
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15),
+                                       headers=conditional_headers) as response:
+                    # urllib raised on 4xx/5xx; aiohttp hands back the error
+                    # page as a normal body, so gate on the status ourselves.
+                    # Server errors are worth retrying, client errors are not.
+                    if response.status >= 400:
+                        print(f"   ⚠️ HTTP {response.status} for {url}")
+                        if response.status >= 500 and attempt < max_retries - 1:
+                            await asyncio.sleep(2)
+                            continue
+                        return None
+
+                    if response.status == 304 and cached:
+                        # Unchanged since the last run - reuse the cached body
+                        body = cached[2]
+                    else:
+                        body = await response.read()
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        if self._cache and (etag or last_modified):
+                            self._cache.put(url, etag, last_modified, body)
+
+                    if as_bytes:
+                        return body
+                    return body.decode('utf-8', errors='ignore')
 
             except Exception as e:
                 print(f"   ⚠️ Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2)
+                    await asyncio.sleep(2)
                 else:
                     return None
 
-    def discover_existing_sitemaps(self):
+    def fetch_url(self, url: str, max_retries: int = 3):
+        """Synchronous wrapper around the async fetcher for one-off callers"""
+        async def _one():
+            async with self._open_session() as session:
+                return await self._fetch(session, url, max_retries)
+
+        return asyncio.run(_one())
+
+    async def discover_existing_sitemaps(self, session):
         """Discover existing sitemap files"""
         print("🔍 Discovering existing sitemaps...")
 
@@ -62,19 +379,30 @@ class FixedSitemapGenerator:
 
         # Check robots.txt first
         robots_url = f"{self.base_url}/robots.txt"
-        content = self.fetch_url(robots_url)
+        content = await self._fetch(session, robots_url)
         if content:
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.lower().startswith('sitemap:'):
-                    sitemap_url = line.split(':', 1)[1].strip()
-                    found_sitemaps.append(sitemap_url)
-                    print(f"   📄 Found in robots.txt: {sitemap_url}")
+            for sitemap_url in _SITEMAP_DIRECTIVE_RE.findall(content):
+                found_sitemaps.append(sitemap_url)
+                print(f"   📄 Found in robots.txt: {sitemap_url}")
+
+        # Probe all well-known locations concurrently - HEAD first so 404s
+        # never download a body, GET only on a 200
+        async def probe(sitemap_url):
+            try:
+                async with session.head(sitemap_url, timeout=aiohttp.ClientTimeout(total=15),
+                                        allow_redirects=True) as response:
+                    if response.status != 200:
+                        return sitemap_url, None
+            except Exception:
+                return sitemap_url, None
+
+            return sitemap_url, await self._fetch(session, sitemap_url, max_retries=1)
+
+        results = await asyncio.gather(
+            *(probe(f"{self.base_url}{location}") for location in sitemap_locations)
+        )
 
-        # Check common sitemap locations
-        for location in sitemap_locations:
-            sitemap_url = f"{self.base_url}{location}"
-            content = self.fetch_url(sitemap_url)
+        for sitemap_url, content in results:
             if content:
                 content_lower = content.lower()
                 if any(tag in content_lower for tag in ['<urlset', '<sitemapindex', 'sitemap']):
@@ -85,107 +413,215 @@ class FixedSitemapGenerator:
 
         return found_sitemaps
 
-    def extract_urls_from_sitemap(self, sitemap_url: str):
-        """Extract URLs from a sitemap file with better error handling"""
+    def _consume_sitemap_events(self, parser, urls, child_sitemaps):
+        """Drain completed <url>/<sitemap> entries from the pull parser"""
+        for event, elem in parser.read_events():
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if tag not in ('url', 'sitemap'):
+                continue
+
+            fields = {}
+            for child in elem:
+                fields[child.tag.rsplit('}', 1)[-1]] = (child.text or '').strip()
+
+            loc = fields.get('loc')
+            if loc:
+                if tag == 'sitemap':
+                    child_sitemaps.append(loc)
+                else:
+                    url_data = self.analyze_and_categorize_url(loc)
+                    url_data.update({
+                        'lastmod': fields.get('lastmod') or self._today,
+                        'changefreq': fields.get('changefreq') or 'weekly',
+                        'priority': fields.get('priority') or '0.5',
+                        'source': 'existing_sitemap'
+                    })
+                    urls.append(url_data)
+
+            elem.clear()
+
+            # lxml keeps cleared elements attached to the root; drop the
+            # processed siblings too so memory stays flat on huge files
+            # (stdlib ElementTree has no getprevious and frees on clear)
+            if hasattr(elem, 'getprevious'):
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    async def extract_urls_from_sitemap(self, session, sitemap_url: str, max_retries: int = 3):
+        """Extract URLs from a sitemap file, parsing while it downloads"""
         print(f"   📖 Reading: {sitemap_url}")
         urls = []
+        child_sitemaps = []
 
-        content = self.fetch_url(sitemap_url)
-        if not content:
-            print(f"   ❌ Failed to fetch: {sitemap_url}")
-            return urls
+        cached = self._cache.get(sitemap_url) if self._cache else None
+        conditional_headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
 
-        try:
-            # Remove XML namespaces for simpler parsing
-            content_clean = re.sub(r'xmlns[^>]*', '', content)
-
-            # Handle sitemap index
-            if '<sitemapindex' in content_clean.lower():
-                sitemap_locs = re.findall(r'<loc>(.*?)</loc>', content_clean)
-                print(f"   📑 Found sitemap index with {len(sitemap_locs)} child sitemaps")
-
-                for child_sitemap in sitemap_locs[:3]:  # Process first 3 to avoid too many requests
-                    child_urls = self.extract_urls_from_sitemap(child_sitemap)
-                    urls.extend(child_urls)
-                    time.sleep(1)
-            else:
-                # Regular sitemap - extract URL entries
-                url_blocks = re.findall(r'<url>(.*?)</url>', content_clean, re.DOTALL)
+        for attempt in range(max_retries):
+            urls.clear()
+            child_sitemaps.clear()
+            parser = etree.XMLPullParser(events=('end',))
 
-                for block in url_blocks:
-                    loc_match = re.search(r'<loc>(.*?)</loc>', block)
-                    lastmod_match = re.search(r'<lastmod>(.*?)</lastmod>', block)
-                    changefreq_match = re.search(r'<changefreq>(.*?)</changefreq>', block)
-                    priority_match = re.search(r'<priority>(.*?)</priority>', block)
+            try:
+                async with session.get(sitemap_url, timeout=aiohttp.ClientTimeout(total=15),
+                                       headers=conditional_headers) as response:
+                    # Same status gate as _fetch - never parse an error page
+                    if response.status >= 400:
+                        print(f"   ⚠️ HTTP {response.status} for {sitemap_url}")
+                        if response.status >= 500 and attempt < max_retries - 1:
+                            await asyncio.sleep(2)
+                            continue
+                        print(f"   ❌ Failed to fetch: {sitemap_url}")
+                        return urls
+
+                    if response.status == 304 and cached:
+                        # Unchanged since the last run - parse the cached body
+                        parser.feed(cached[2])
+                    else:
+                        # Feed each chunk as it arrives so parsing overlaps
+                        # the download; chunks are kept only to refresh the
+                        # conditional-GET cache afterwards
+                        body_parts = []
+                        async for chunk in response.content.iter_chunked(65536):
+                            parser.feed(chunk)
+                            self._consume_sitemap_events(parser, urls, child_sitemaps)
+                            body_parts.append(chunk)
+
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                        if self._cache and (etag or last_modified):
+                            self._cache.put(sitemap_url, etag, last_modified, b''.join(body_parts))
+
+                parser.close()
+                self._consume_sitemap_events(parser, urls, child_sitemaps)
+                break
 
-                    if loc_match:
-                        url_data = self.analyze_and_categorize_url(loc_match.group(1))
-                        url_data.update({
-                            'lastmod': lastmod_match.group(1) if lastmod_match else datetime.datetime.now().strftime('%Y-%m-%d'),
-                            'changefreq': changefreq_match.group(1) if changefreq_match else 'weekly',
-                            'priority': priority_match.group(1) if priority_match else '0.5',
-                            'source': 'existing_sitemap'
-                        })
-                        urls.append(url_data)
+            except Exception as e:
+                print(f"   ⚠️ Attempt {attempt + 1} failed for {sitemap_url}: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2)
+                else:
+                    print(f"   ❌ Failed to fetch: {sitemap_url}")
+                    return urls
 
-        except Exception as e:
-            print(f"   ❌ Error parsing sitemap {sitemap_url}: {e}")
+        # Handle sitemap index
+        if child_sitemaps:
+            print(f"   📑 Found sitemap index with {len(child_sitemaps)} child sitemaps")
+
+            for child_sitemap in child_sitemaps[:3]:  # Process first 3 to avoid too many requests
+                child_urls = await self.extract_urls_from_sitemap(session, child_sitemap)
+                urls.extend(child_urls)
 
         print(f"   ✅ Extracted {len(urls)} URLs from {sitemap_url}")
         return urls
 
-    def crawl_website_from_homepage(self):
+    async def crawl_website_from_homepage(self, session):
         """Crawl website starting from homepage to discover all accessible links"""
         print("🌐 Crawling website from homepage...")
 
         visited = set()
-        to_visit = [self.base_url]
+        queued = {self.base_url}
+        to_visit = asyncio.Queue()
+        await to_visit.put(self.base_url)
         discovered_urls = []
-        page_count = 0
-
-        while to_visit and page_count < self.max_crawl_pages:
-            current_url = to_visit.pop(0)
-
-            if current_url in visited:
-                continue
-
-            page_count += 1
-            if page_count % 10 == 0:
-                print(f"   📊 Progress: {page_count} pages crawled, {len(discovered_urls)} URLs found")
-
-            content = self.fetch_url(current_url)
-
-            if content:
-                visited.add(current_url)
-
-                # Categorize and add current URL
-                url_data = self.analyze_and_categorize_url(current_url)
-                url_data.update({
-                    'lastmod': datetime.datetime.now().strftime('%Y-%m-%d'),
-                    'source': 'crawler'
-                })
-                discovered_urls.append(url_data)
-
-                # Extract links from page
-                links = self.extract_links_from_html(content, current_url)
-
-                for link in links:
-                    if (self.is_valid_url(link) and
-                        link not in visited and
-                        link not in to_visit and
-                        len(to_visit) < 500):  # Limit queue size
-                        to_visit.append(link)
-
-        print(f"   ✅ Crawling completed: {len(discovered_urls)} URLs found from {page_count} pages")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        state = {'page_count': 0}
+
+        async def worker():
+            while True:
+                current_url = await to_visit.get()
+                try:
+                    if current_url in visited or state['page_count'] >= self.max_crawl_pages:
+                        continue
+                    visited.add(current_url)
+
+                    state['page_count'] += 1
+                    if state['page_count'] % 10 == 0:
+                        print(f"   📊 Progress: {state['page_count']} pages crawled, {len(discovered_urls)} URLs found")
+
+                    # Bytes all the way through - the link extractors never
+                    # need the page decoded
+                    async with semaphore:
+                        content = await self._fetch(session, current_url, as_bytes=True)
+
+                    if content:
+                        # Categorize and add current URL
+                        url_data = self.analyze_and_categorize_url(current_url)
+                        url_data.update({
+                            'lastmod': self._today,
+                            'source': 'crawler'
+                        })
+                        discovered_urls.append(url_data)
+
+                        # An unchanged body of the same page (e.g. 304-cached
+                        # re-runs) skips the HTML parser via the link cache;
+                        # keying on the page URL too keeps relative hrefs from
+                        # one page out of another page's (or site's) results
+                        body_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+                        links = (self._cache.get_links(current_url, body_hash)
+                                 if self._cache else None)
+
+                        if links is None:
+                            # Extract links from page off the event loop - parsing
+                            # a multi-MB body inline would stall every other worker
+                            links = await asyncio.get_running_loop().run_in_executor(
+                                None, self.extract_links_from_html, content, current_url)
+                            if self._cache:
+                                self._cache.put_links(current_url, body_hash, links)
+
+                        # Links are already validated by extract_links_from_html;
+                        # O(1) set membership keeps each URL queued at most once
+                        for link in links:
+                            if link not in visited and link not in queued:
+                                queued.add(link)
+                                await to_visit.put(link)
+                except Exception as e:
+                    # _fetch handles its own errors; anything else (e.g. a
+                    # failing cache db) must not kill the worker task, or
+                    # to_visit.join() would hang on the remaining items
+                    print(f"   ⚠️ Error processing {current_url}: {e}")
+                finally:
+                    to_visit.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        await to_visit.join()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        print(f"   ✅ Crawling completed: {len(discovered_urls)} URLs found from {state['page_count']} pages")
         return discovered_urls
 
-    def extract_links_from_html(self, html_content: str, base_url: str):
-        """Extract all links from HTML content"""
+    def extract_links_from_html(self, html_content, base_url: str):
+        """Extract all links from HTML content (str or bytes)"""
         links = []
 
-        # Find all href attributes
-        href_pattern = r'href=[\'"]([^\'"]*?)[\'"]'
-        matches = re.findall(href_pattern, html_content, re.IGNORECASE)
+        matches = None
+        if HTMLParser is not None:
+            try:
+                # Tokenized attribute extraction - also catches hrefs with
+                # entities or escaped quotes that the regex misreads;
+                # selectolax takes bytes directly, skipping the body decode
+                matches = [node.attributes.get('href')
+                           for node in HTMLParser(html_content).css('a[href]')
+                           if node.attributes.get('href')]
+            except Exception:
+                matches = None
+
+        if matches is None:
+            # Fall back to the regex scan; on bytes only the matched hrefs
+            # are decoded (URLs are ASCII after percent-encoding), never the
+            # whole document
+            if isinstance(html_content, bytes):
+                matches = [href.decode('ascii', errors='ignore')
+                           for href in _HREF_RE_B.findall(html_content)]
+            else:
+                matches = _HREF_RE.findall(html_content)
 
         for match in matches:
             try:
@@ -199,40 +635,30 @@ class FixedSitemapGenerator:
 
     def is_valid_url(self, url: str):
         """Validate if URL should be included in sitemap"""
-        if not url.startswith(self.base_url):
+        try:
+            parsed = urlparse(url)
+        except ValueError:
             return False
 
-        # Exclude common file types
-        excluded_extensions = [
-            '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico',
-            '.pdf', '.doc', '.docx', '.zip', '.rar',
-            '.mp4', '.mp3', '.avi', '.mov',
-            '.css', '.js', '.woff', '.ttf'
-        ]
-
-        if any(url.lower().endswith(ext) for ext in excluded_extensions):
+        # Exact host match - a plain prefix test would also accept hosts
+        # like example.com.evil.org
+        if parsed.netloc.lower() != self._base_netloc:
             return False
 
-        # Exclude common non-content URLs
-        excluded_patterns = [
-            '/cdn-cgi/', '/wp-admin/', '/wp-json/', '/api/', '/ajax/',
-            '/logout', '/login', '/signin', '/signup', '/register',
-            '/admin', '/dashboard', '/backend',
-            '/cart', '/checkout', '/account',
-            '?replytocom=', '?share=', '?feed=', '?s=',
-            '#', 'tel:', 'mailto:', 'javascript:'
-        ]
-
-        if any(pattern in url.lower() for pattern in excluded_patterns):
+        # Exclude common file types by the path's extension
+        dot = parsed.path.rfind('.')
+        if dot != -1 and parsed.path[dot + 1:].lower() in _SKIP_EXTS:
             return False
 
-        return True
+        # Excluded non-content URLs in one scan
+        return _EXCL_RE.search(url.lower()) is None
 
     def analyze_and_categorize_url(self, url: str):
         """Analyze URL and categorize it with proper directory structure"""
         try:
             parsed = urlparse(url)
             path = parsed.path
+            path_lower = path.lower()
             path_parts = [part for part in path.split('/') if part]
 
             # Ensure all required fields are present
@@ -255,29 +681,11 @@ class FixedSitemapGenerator:
                 })
                 return url_data
 
-            # Contact pages
-            if any(term in path for term in ['/contact', '/connect', '/get-in-touch']):
-                url_data.update({
-                    'category': 'contact',
-                    'priority': '0.8'
-                })
-                return url_data
-
-            # About pages
-            if any(term in path for term in ['/about', '/about-us', '/company']):
-                url_data.update({
-                    'category': 'about',
-                    'priority': '0.8'
-                })
-                return url_data
-
-            # Article/News pages
-            if any(pattern in url.lower() for pattern in ['/article/', '/news/', '/blog/', '/post/', '/story/']):
-                url_data.update({
-                    'category': 'articles',
-                    'priority': '0.8',
-                    'changefreq': 'daily'
-                })
+            # Contact/about/article pages - one scan instead of a list of
+            # substring checks per category
+            match = _CATEGORY_RE.search(path_lower)
+            if match and match.lastgroup != 'legal':
+                url_data.update(_CATEGORY_RULES[match.lastgroup])
                 return url_data
 
             # Category pages (first level directories)
@@ -308,12 +716,8 @@ class FixedSitemapGenerator:
                 return url_data
 
             # Legal pages
-            if any(term in path for term in ['/privacy', '/terms', '/policy', '/disclaimer']):
-                url_data.update({
-                    'category': 'legal',
-                    'priority': '0.3',
-                    'changefreq': 'yearly'
-                })
+            if match and match.lastgroup == 'legal':
+                url_data.update(_CATEGORY_RULES['legal'])
                 return url_data
 
             return url_data
@@ -368,30 +772,32 @@ class FixedSitemapGenerator:
         print(f"   📂 Organized into {len(directory_map)} directories and {len(category_map)} categories")
         return directory_map, category_map
 
-    def discover_all_urls(self):
+    async def _discover_all_urls(self, session):
         """Comprehensive URL discovery using multiple methods"""
         print("🚀 Starting comprehensive URL discovery...")
 
-        all_urls = []
+        # Dedupe as each source arrives instead of collecting everything
+        # into one big list and re-scanning it afterwards
+        deduper = _UrlDeduper()
+        unique_urls = []
+
+        def extend_unique(source_urls):
+            for url_data in source_urls:
+                loc = url_data.get('loc')
+                if loc and deduper.add(loc):
+                    unique_urls.append(url_data)
 
         # Method 1: Extract from existing sitemaps
-        existing_sitemaps = self.discover_existing_sitemaps()
+        existing_sitemaps = await self.discover_existing_sitemaps(session)
         for sitemap_url in existing_sitemaps:
-            urls = self.extract_urls_from_sitemap(sitemap_url)
-            all_urls.extend(urls)
-            time.sleep(1)
+            extend_unique(await self.extract_urls_from_sitemap(session, sitemap_url))
 
         # Method 2: Always crawl website from homepage to get fresh links
         print("🌐 Starting comprehensive website crawl from homepage...")
-        crawled_urls = self.crawl_website_from_homepage()
-        all_urls.extend(crawled_urls)
+        extend_unique(await self.crawl_website_from_homepage(session))
 
         # Method 3: Generate essential URLs
-        essential_urls = self.generate_essential_urls()
-        all_urls.extend(essential_urls)
-
-        # Remove duplicates
-        unique_urls = self.deduplicate_urls(all_urls)
+        extend_unique(self.generate_essential_urls())
 
         # Organize by directory structure
         directory_map, category_map = self.organize_urls_by_directory(unique_urls)
@@ -401,6 +807,14 @@ class FixedSitemapGenerator:
 
         return unique_urls, directory_map, category_map
 
+    def discover_all_urls(self):
+        """Run the async discovery pipeline under one shared session"""
+        async def _run():
+            async with self._open_session() as session:
+                return await self._discover_all_urls(session)
+
+        return asyncio.run(_run())
+
     def generate_essential_urls(self):
         """Generate essential URLs that should be in every sitemap"""
         essential_paths = [
@@ -416,55 +830,74 @@ class FixedSitemapGenerator:
         for path in essential_paths:
             url = f"{self.base_url}{path}"
             url_data = self.analyze_and_categorize_url(url)
-            url_data['lastmod'] = datetime.datetime.now().strftime('%Y-%m-%d')
+            url_data['lastmod'] = self._today
             url_data['source'] = 'generated'
             essential_urls.append(url_data)
 
         return essential_urls
 
     def deduplicate_urls(self, urls):
-        """Remove duplicate URLs"""
-        unique_urls = []
-        seen = set()
-
+        """Remove duplicate URLs, collapsing trivial variants via canonicalization"""
+        # setdefault keeps first-seen-wins semantics in one C-level hash
+        # pass; insertion order is preserved
+        unique = {}
         for url_data in urls:
-            url = url_data.get('loc', '')
-            if url and url not in seen:
-                unique_urls.append(url_data)
-                seen.add(url)
+            loc = url_data.get('loc')
+            if loc:
+                unique.setdefault(canonicalize_url(loc), url_data)
 
-        return unique_urls
+        return list(unique.values())
+
+    def _write_atomic(self, path: str, document: str, compress: bool = False):
+        """Write a file via a temp name + os.replace so readers never see a
+        partial document if the run crashes mid-write"""
+        directory, filename = os.path.split(path)
+        tmp_path = os.path.join(directory, f'.{filename}.tmp')
+
+        if compress:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=_GZIP_LEVEL) as f:
+                f.write(document)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(document)
 
-    def generate_sitemap_index(self, sitemap_files):
+        os.replace(tmp_path, path)
+
+    def generate_sitemap_index(self, sitemap_files, out_dir: str = '.'):
         """Generate main sitemap index file with all discovered links"""
         filename = "sitemap_index.xml"
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        today = self._today
 
         print("📑 Generating sitemap index with all discovered links...")
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        parts = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+                 '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+
+        for sitemap_file in sitemap_files:
+            # Use absolute URLs in sitemap index
+            sitemap_url = f"{self.base_url}/{sitemap_file}"
 
-            for sitemap_file in sitemap_files:
-                # Use absolute URLs in sitemap index
-                sitemap_url = f"{self.base_url}/{sitemap_file}"
+            parts.append('  <sitemap>\n'
+                         f'    <loc>{self.escape_xml(sitemap_url)}</loc>\n'
+                         f'    <lastmod>{today}</lastmod>\n'
+                         '  </sitemap>\n')
 
-                f.write('  <sitemap>\n')
-                f.write(f'    <loc>{self.escape_xml(sitemap_url)}</loc>\n')
-                f.write(f'    <lastmod>{today}</lastmod>\n')
-                f.write('  </sitemap>\n')
+        parts.append('</sitemapindex>\n')
 
-            f.write('</sitemapindex>\n')
+        self._write_atomic(os.path.join(out_dir, filename), ''.join(parts))
 
         print(f"   ✅ Generated: {filename} with {len(sitemap_files)} sitemap references")
         return filename
 
-    def generate_directory_sitemap(self, directory_name: str, urls):
+    def generate_directory_sitemap(self, directory_name: str, urls, compress: bool = None,
+                                   out_dir: str = '.'):
         """Generate sitemap for a specific directory"""
         if not urls:
             return None
 
+        if compress is None:
+            compress = self.compress
+
         # Create filename based on directory name
         if directory_name == 'homepage':
             filename = "sitemap.xml"
@@ -473,22 +906,34 @@ class FixedSitemapGenerator:
             clean_name = re.sub(r'[^a-zA-Z0-9_-]', '', directory_name.lower())
             filename = f"sitemap-{clean_name}.xml"
 
+        if compress:
+            filename += '.gz'
+
         print(f"   📄 Generating directory sitemap: {filename} ({len(urls)} URLs)")
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
-
-                for url_data in urls:
-                    f.write('  <url>\n')
-                    f.write(f'    <loc>{self.escape_xml(url_data["loc"])}</loc>\n')
-                    f.write(f'    <lastmod>{url_data.get("lastmod", datetime.datetime.now().strftime("%Y-%m-%d"))}</lastmod>\n')
-                    f.write(f'    <changefreq>{url_data.get("changefreq", "weekly")}</changefreq>\n')
-                    f.write(f'    <priority>{url_data.get("priority", "0.5")}</priority>\n')
-                    f.write('  </url>\n')
-
-                f.write('</urlset>\n')
+            # Build the whole document in memory and flush it with a single
+            # write - avoids five Python-level writes per URL
+            parts = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+                     '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+
+            # Local bindings shave the attribute lookups out of the hot loop
+            append = parts.append
+            esc = self.escape_xml
+            today = self._today
+            for url_data in urls:
+                append(_URL_TEMPLATE % (
+                    esc(url_data["loc"]),
+                    url_data.get("lastmod", today),
+                    url_data.get("changefreq", "weekly"),
+                    url_data.get("priority", "0.5")
+                ))
+
+            parts.append('</urlset>\n')
+
+            # Search engines accept .xml.gz sitemaps, and XML compresses
+            # ~5-10x, so write the compressed artifact directly
+            self._write_atomic(os.path.join(out_dir, filename), ''.join(parts), compress=compress)
 
             return filename
 
@@ -496,7 +941,7 @@ class FixedSitemapGenerator:
             print(f"   ❌ Error generating sitemap {filename}: {e}")
             return None
 
-    def generate_hierarchical_sitemaps(self, directory_map, category_map):
+    def generate_hierarchical_sitemaps(self, directory_map, category_map, out_dir: str = '.'):
         """Generate hierarchical sitemaps based on directory structure"""
         print("🏗️ Generating hierarchical sitemaps by directory structure...")
 
@@ -504,6 +949,11 @@ class FixedSitemapGenerator:
 
         # Strategy 1: Create sitemaps by directory (primary organization)
         print("   📂 Creating directory-based sitemaps...")
+
+        # Collect the (name, urls) write jobs first, then run them in a
+        # thread pool - the writes are independent and I/O-bound, and the
+        # GIL is released during file I/O
+        write_jobs = []
         for directory_name, urls in directory_map.items():
             if urls:
                 # If directory has too many URLs, split it
@@ -517,21 +967,24 @@ class FixedSitemapGenerator:
                         chunk_urls = urls[start_idx:end_idx]
 
                         if chunk_urls:
-                            chunk_name = f"{directory_name}-part{i+1}"
-                            sitemap_file = self.generate_directory_sitemap(chunk_name, chunk_urls)
-                            if sitemap_file:
-                                sitemap_files.append(sitemap_file)
+                            write_jobs.append((f"{directory_name}-part{i+1}", chunk_urls))
                 else:
-                    sitemap_file = self.generate_directory_sitemap(directory_name, urls)
-                    if sitemap_file:
-                        sitemap_files.append(sitemap_file)
+                    write_jobs.append((directory_name, urls))
+
+        if write_jobs:
+            with ThreadPoolExecutor(max_workers=min(8, len(write_jobs))) as executor:
+                futures = [executor.submit(self.generate_directory_sitemap, name, urls,
+                                           out_dir=out_dir)
+                           for name, urls in write_jobs]
+                sitemap_files = [future.result() for future in futures if future.result()]
 
         # Strategy 2: If no directory sitemaps created, use categories
         if not sitemap_files:
             print("   🎯 Creating category-based sitemaps as fallback...")
             for category_name, urls in category_map.items():
                 if urls:
-                    sitemap_file = self.generate_directory_sitemap(category_name, urls)
+                    sitemap_file = self.generate_directory_sitemap(category_name, urls,
+                                                                   out_dir=out_dir)
                     if sitemap_file:
                         sitemap_files.append(sitemap_file)
 
@@ -541,7 +994,7 @@ class FixedSitemapGenerator:
             all_urls = []
             for urls in directory_map.values():
                 all_urls.extend(urls)
-            sitemap_file = self.generate_directory_sitemap("all", all_urls)
+            sitemap_file = self.generate_directory_sitemap("all", all_urls, out_dir=out_dir)
             if sitemap_file:
                 sitemap_files.append(sitemap_file)
 
@@ -552,20 +1005,11 @@ class FixedSitemapGenerator:
         if not text:
             return ""
 
-        escapes = {
-            '&': '&amp;',
-            '<': '&lt;',
-            '>': '&gt;',
-            '"': '&quot;',
-            "'": '&apos;'
-        }
-
-        for char, escape in escapes.items():
-            text = text.replace(char, escape)
-
-        return text
+        # Single C-level pass instead of five sequential str.replace copies
+        return text.translate(_XML_ESCAPES)
 
-    def generate_comprehensive_report(self, all_urls, directory_map, category_map, sitemap_files):
+    def generate_comprehensive_report(self, all_urls, directory_map, category_map, sitemap_files,
+                                      out_dir: str = '.'):
         """Generate detailed analytics report"""
         print("📊 Generating comprehensive analytics report...")
 
@@ -581,11 +1025,24 @@ class FixedSitemapGenerator:
                 'directories_count': len(directory_map),
                 'categories_count': len(category_map)
             },
+            'urls_by_priority': {},
+            'urls_by_changefreq': {},
             'directory_breakdown': {},
             'category_breakdown': {},
             'sitemap_files': sitemap_files
         }
 
+        # Priority and changefreq distributions - both counters fill in a
+        # single traversal of the URL list
+        priority_counts = Counter()
+        changefreq_counts = Counter()
+        for url_data in all_urls:
+            priority_counts[url_data.get('priority', '0.5')] += 1
+            changefreq_counts[url_data.get('changefreq', 'weekly')] += 1
+
+        report['urls_by_priority'] = dict(priority_counts)
+        report['urls_by_changefreq'] = dict(changefreq_counts)
+
         # Directory breakdown
         for directory, urls in directory_map.items():
             report['directory_breakdown'][directory] = {
@@ -600,8 +1057,13 @@ class FixedSitemapGenerator:
             }
 
         # Save detailed report
-        with open('sitemap-analysis-report.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        report_path = os.path.join(out_dir, 'sitemap-analysis-report.json')
+        if orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
 
         # Print executive summary
         self.print_executive_summary(report)
@@ -641,10 +1103,12 @@ class FixedSitemapGenerator:
         print(f"🌐 Target Website: {self.base_url}")
         print("="*70)
 
-        # Create output directory
+        # Create output directory - passed through explicitly instead of
+        # mutating the process-global cwd with os.chdir
         os.makedirs(output_dir, exist_ok=True)
-        original_dir = os.getcwd()
-        os.chdir(output_dir)
+
+        if self._cache is None:
+            self._open_cache(os.path.join(output_dir, '.sitemap-http-cache.db'))
 
         try:
             # Discover and organize all URLs
@@ -655,21 +1119,24 @@ class FixedSitemapGenerator:
                 # Create at least a basic sitemap with homepage
                 basic_urls = self.generate_essential_urls()
                 if basic_urls:
-                    sitemap_file = self.generate_directory_sitemap("basic", basic_urls)
+                    sitemap_file = self.generate_directory_sitemap("basic", basic_urls,
+                                                                   out_dir=output_dir)
                     if sitemap_file:
-                        self.generate_sitemap_index([sitemap_file])
+                        self.generate_sitemap_index([sitemap_file], out_dir=output_dir)
                         print("✅ Created basic sitemap with essential URLs")
                 return
 
             # Generate hierarchical sitemaps based on directory structure
-            sitemap_files = self.generate_hierarchical_sitemaps(directory_map, category_map)
+            sitemap_files = self.generate_hierarchical_sitemaps(directory_map, category_map,
+                                                                out_dir=output_dir)
 
             # Generate professional sitemap index
             if sitemap_files:
-                index_file = self.generate_sitemap_index(sitemap_files)
+                index_file = self.generate_sitemap_index(sitemap_files, out_dir=output_dir)
 
                 # Generate comprehensive report
-                self.generate_comprehensive_report(all_urls, directory_map, category_map, sitemap_files)
+                self.generate_comprehensive_report(all_urls, directory_map, category_map,
+                                                   sitemap_files, out_dir=output_dir)
 
                 print(f"\n✅ sitemap structure generated successfully!")
                 print(f"📁 Output directory: {output_dir}")
@@ -681,11 +1148,34 @@ class FixedSitemapGenerator:
             print(f"❌ Error during sitemap generation: {e}")
             import traceback
             traceback.print_exc()
-        finally:
-            os.chdir(original_dir)
+
+def install_fastest_event_loop():
+    """Install the fastest available asyncio event loop policy.
+
+    Prefers an io_uring-backed loop (Linux kernel 5.11+) to batch socket
+    syscalls, then uvloop, then falls back to the default selector loop
+    (e.g. on Windows or older kernels).
+    """
+    try:
+        import uringcore
+        asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+        return 'uringcore'
+    except ImportError:
+        pass
+
+    try:
+        import uvloop
+        uvloop.install()
+        return 'uvloop'
+    except ImportError:
+        pass
+
+    return 'asyncio'
 
 def main():
     """Command line interface for the fixed sitemap generator"""
+    install_fastest_event_loop()
+
     parser = argparse.ArgumentParser(
         description='Sitemap Generator - Robust sitemap generation with better error handling'
     )
@@ -697,6 +1187,8 @@ def main():
                        help='Maximum pages to crawl (default: 1000)')
     parser.add_argument('--output-dir', default='sitemaps',
                        help='Output directory (default: sitemaps)')
+    parser.add_argument('--no-compress', action='store_true',
+                       help='Write plain .xml sitemaps instead of gzipped .xml.gz')
 
     args = parser.parse_args()
 
@@ -708,7 +1200,8 @@ def main():
     generator = FixedSitemapGenerator(
         base_url=args.url,
         max_urls_per_sitemap=args.max_urls,
-        max_crawl_pages=args.max_crawl
+        max_crawl_pages=args.max_crawl,
+        compress=not args.no_compress
     )
 
     generator.generate_complete_sitemap_structure(args.output_dir)